@@ -1,3 +1,4 @@
+import numpy as np
 import jlab as jl
 
 def test_resistor_functions():
@@ -12,8 +13,136 @@ def test_voltage_divider():
     assert np.isclose(jl.voltage_divider(10, [1000, 1000]), 5.0)
     assert np.isclose(jl.voltage_divider(12, [2000, 1000]), 4.0)
 
+def test_ladder():
+    voltages, currents, load_currents = jl.ladder_solve(3, [1, 1, 1])
+    assert np.allclose(voltages, jl.voltage_divider(3, [1, 1, 1]))
+    resistors, loads = jl.r2r_ladder(8)
+    voltages, currents, load_currents = jl.ladder_solve(1.0, resistors, loads)
+    assert np.allclose(voltages, 0.5 ** np.arange(1, 9))
+    assert np.allclose(currents[:-1], currents[1:] + load_currents)
+
+def test_sensitivity():
+    f = np.geomspace(1e2, 1e7, 50)
+    h = 1e-6
+    dG_dR, dG_dL, dG_dC = jl.bandpass_gain_sensitivity(10.03e3, 9.97e-3, 10.06e-9, f)
+    numeric = (jl.bandpass_gain(10.03e3 * (1 + h), 9.97e-3, 10.06e-9, f)
+               - jl.bandpass_gain(10.03e3 * (1 - h), 9.97e-3, 10.06e-9, f)) / (2 * h * 10.03e3)
+    assert np.allclose(dG_dR, numeric, atol=1e-8 * np.abs(dG_dR).max())
+    d_series, d_load = jl.ladder_sensitivity(5.0, [1000, 2000, 3000], output=0)
+    assert np.allclose(d_series, jl.voltage_divider_sensitivity(5.0, [1000, 2000, 3000])[0])
+
+def test_live_bode_plot():
+    import matplotlib.pyplot as plt
+    plt.switch_backend("Agg")
+    live = jl.LiveBodePlot(capacity=4)
+    freqs = [1e4, 1e2, 1e6, 3e3, 5e5, 10.0, 2e5, 7e3, 1e3]
+    for f in freqs:
+        live.append(f, 1.0 / f, -45.0)
+    order = np.argsort(freqs)
+    assert np.all(np.diff(live.freqs) >= 0)
+    assert np.allclose(live.mags, 20 * np.log10(1.0 / np.array(freqs)[order]))
+    try:
+        live.append(1e3, 0.5)
+        assert False, "append without phase should raise"
+    except ValueError:
+        pass
+    plt.close(live.fig)
+    # a failed first point arrives as NaN and must not break the limits
+    live = jl.LiveBodePlot()
+    live.append(1e3, np.nan, np.nan)
+    live.append(2e3, 0.5, -10.0)
+    assert live.freqs.size == 2 and np.isclose(live.mags[1], 20 * np.log10(0.5))
+    plt.close(live.fig)
+
+def test_parse_si():
+    values = jl.parse_si(["10.07k", "991p", "9.96k\u03a9", "1n", "4k7", ""])
+    assert np.array_equal(values[:5], [10.07e3, 991e-12, 9.96e3, 1e-9, 4.7e3])
+    assert np.isnan(values[5])
+    assert np.isclose(jl.parallel_resistors(jl.parse_si(["1k", "1k"])), 500)
+    for typo in ("1k5k", "F", "k"):
+        try:
+            jl.parse_si(["1k", typo])
+            assert False, f"{typo!r} should not parse"
+        except ValueError:
+            pass
+
+def test_group_delay():
+    f = np.geomspace(1e2, 1e7, 100000)
+    H = jl.bandpass_transfer_function(10.03e3, 9.97e-3, 10.06e-9, f)
+    tau = jl.bandpass_group_delay(10.03e3, 9.97e-3, 10.06e-9, f)
+    assert np.allclose(jl.group_delay(f, H), tau, atol=1e-6 * tau.max())
+    assert np.isclose(jl.unwrapped_phase(jl.lowpass_transfer_function(1e4, 1e-9, f) ** 4, deg=True)[-1], -360, atol=1)
+
+def test_frequency_response_estimate():
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=200000)
+    y = 0.5 * x + 0.5 * np.concatenate(([0.0], x[:-1]))  # two-tap average, H = 0.5 (1 + e^{-jw})
+    f, H, coherence = jl.estimate_frequency_response(x, y, sample_rate=1.0, nperseg=256, chunk_size=10007)
+    assert np.allclose(H, 0.5 * (1 + np.exp(-2j * np.pi * f)), atol=1e-2)
+    assert np.all(coherence[:100] > 0.99)
+
+def test_thermal_noise():
+    kT = 1.380649e-23 * 300.0
+    assert np.isclose(jl.lowpass_noise(1e4, 1e-9), np.sqrt(kT / 1e-9), rtol=1e-4)
+    assert np.isclose(jl.highpass_noise(1e4, 1e-9), np.sqrt(kT / 1e-9), rtol=1e-4)
+    # sub-hertz cutoff and a Q = 1000 resonance at 159 Hz
+    assert np.allclose(jl.lowpass_noise(1e6, [1e-6, 1e-5]), np.sqrt(kT / np.array([1e-6, 1e-5])), rtol=1e-4)
+    assert np.isclose(jl.bandpass_noise(1e6, 1.0, 1e-6), np.sqrt(kT / 1e-6), rtol=1e-4)
+    assert np.allclose(jl.voltage_divider_noise([1000, 1000], 0, 1e4), np.sqrt(4 * kT * 500 * 1e4))
+
+def test_simulated_sweep():
+    freqs = np.logspace(3, 6, 20)
+    instrument = jl.SimulatedInstrument.lowpass(9.96e3, 1e-9)
+    f, mags, phase = jl.run_simulated_sweep(instrument, freqs)
+    assert np.allclose(mags, jl.lowpass_gain(9.96e3, 1e-9, freqs), atol=1e-6)
+    assert np.allclose(phase, np.degrees(jl.lowpass_delta_angle(9.96e3, 1e-9, freqs)), atol=1e-4)
+    try:
+        jl.run_simulated_sweep(instrument, freqs, periods=0)
+        assert False, "a non-positive ACQ:PER should be rejected"
+    except RuntimeError:
+        pass
+    try:
+        jl.run_simulated_sweep(instrument, freqs, depth=0)
+        assert False, "depth=0 should be rejected"
+    except ValueError:
+        pass
+    # with a settle time, pipelining overlaps each record's transfer with the next settle
+    import time
+    settling = jl.SimulatedInstrument.lowpass(9.96e3, 1e-9, settle_time=0.05)
+    elapsed = {}
+    for depth in (1, 4):
+        start = time.perf_counter()
+        jl.run_simulated_sweep(settling, freqs[:8], points=20000, depth=depth)
+        elapsed[depth] = time.perf_counter() - start
+    assert elapsed[4] < 0.9 * elapsed[1], elapsed
+
+def test_datasets():
+    import os, tempfile
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "divider.jlab")
+        jl.write_dataset(path, [1e3, 1e4, 1e5], [0.4, 0.4, 0.4], components={"R1": "10k", "R2": "15k"}, capacity=3)
+        jl.append_dataset(path, [1e6, 2e6], [0.4, 0.38], [0.0, -5.0])
+        data = jl.load_dataset(path)
+        assert np.allclose(data["freqs"], [1e3, 1e4, 1e5, 1e6, 2e6])
+        assert np.allclose(data["mags"], [0.4, 0.4, 0.4, 0.4, 0.38])
+        assert np.isnan(data["phase"][0]) and data["phase"][-1] == -5.0
+        assert data["components"] == {"R1": 10e3, "R2": 15e3}
+        jl.write_dataset(os.path.join(folder, "lowpass.jlab"), [750, 5e3], [1.0, 0.96], components={"R": 9.98e3, "C": 1e-9})
+        assert jl.find_datasets(folder, R1="10k") == [path]
+        assert jl.find_datasets(folder, f_range=(1.5e6, None)) == [path]
+        assert len(jl.find_datasets(folder, f_range=(None, 1e3))) == 2
+
 if __name__ == "__main__":
     test_resistor_functions()
     test_capacitor_functions()
     test_voltage_divider()
+    test_ladder()
+    test_sensitivity()
+    test_live_bode_plot()
+    test_parse_si()
+    test_group_delay()
+    test_frequency_response_estimate()
+    test_thermal_noise()
+    test_simulated_sweep()
+    test_datasets()
     print("All tests passed.")
\ No newline at end of file
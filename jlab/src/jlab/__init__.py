@@ -17,12 +17,73 @@ from .voltage_dividers import (
     transfer_function_voltage_divider,
 )
 
+from .ladder import (
+    ladder_solve,
+    r2r_ladder,
+)
+
 from .filters_lowpass import *
 from .filters_highpass import *
 from .filters_bandpass import *
 
+from .si_values import (
+    parse_si,
+    iter_bom,
+    read_bom,
+)
+
+from .response_analysis import (
+    unwrapped_phase,
+    group_delay,
+    nyquist_data,
+    nichols_data,
+)
+
+from .spectral_estimation import (
+    log_chirp,
+    WelchEstimator,
+    estimate_frequency_response,
+    compare_to_model,
+)
+
+from .sensitivity import (
+    lowpass_gain_sensitivity,
+    highpass_gain_sensitivity,
+    bandpass_gain_sensitivity,
+    lowpass_cutoff_sensitivity,
+    highpass_cutoff_sensitivity,
+    bandpass_center_sensitivity,
+    voltage_divider_sensitivity,
+    ladder_sensitivity,
+)
+
+from .noise import (
+    resistor_noise_density,
+    voltage_divider_noise,
+    lowpass_noise,
+    highpass_noise,
+    bandpass_noise,
+)
+
 from .bode_plot import *
 
+from .simulated_instrument import SimulatedInstrument
+
+from .sweep import (
+    complex_gain,
+    sweep,
+    run_sweep,
+    run_simulated_sweep,
+)
+
+from .datasets import (
+    write_dataset,
+    append_dataset,
+    read_dataset_info,
+    load_dataset,
+    find_datasets,
+)
+
 from .opamps import *
 
 __all__ = [
@@ -35,6 +96,45 @@ __all__ = [
     "voltage_divider",
     "current_through_voltage_divider",
     "transfer_function_voltage_divider",
+    "ladder_solve",
+    "r2r_ladder",
+    "parse_si",
+    "iter_bom",
+    "read_bom",
+    "unwrapped_phase",
+    "group_delay",
+    "nyquist_data",
+    "nichols_data",
+    "log_chirp",
+    "WelchEstimator",
+    "estimate_frequency_response",
+    "compare_to_model",
+    "lowpass_gain_sensitivity",
+    "highpass_gain_sensitivity",
+    "bandpass_gain_sensitivity",
+    "lowpass_cutoff_sensitivity",
+    "highpass_cutoff_sensitivity",
+    "bandpass_center_sensitivity",
+    "voltage_divider_sensitivity",
+    "ladder_sensitivity",
+    "resistor_noise_density",
+    "voltage_divider_noise",
+    "lowpass_noise",
+    "highpass_noise",
+    "bandpass_noise",
     "bode_plot",
+    "nyquist_plot",
+    "nichols_plot",
+    "LiveBodePlot",
+    "SimulatedInstrument",
+    "complex_gain",
+    "sweep",
+    "run_sweep",
+    "run_simulated_sweep",
+    "write_dataset",
+    "append_dataset",
+    "read_dataset_info",
+    "load_dataset",
+    "find_datasets",
     "opamp_gain_magnitude"
 ]
@@ -3,6 +3,8 @@ from typing import Optional, Tuple, Union
 
 import matplotlib.pyplot as plt
 
+from .response_analysis import nichols_data, nyquist_data
+
 def bode_plot(
     freqs: Union[np.ndarray, list],
     mags: Union[np.ndarray, list],
@@ -115,4 +117,309 @@ def bode_plot(
         ax_phase.set_xticklabels([_fmt_xtick(t) for t in xticks])
 
         fig.tight_layout()
-        return fig, (ax_mag, ax_phase)
\ No newline at end of file
+        return fig, (ax_mag, ax_phase)
+
+def nyquist_plot(
+    H: Union[np.ndarray, list],
+    title: str = "Nyquist Plot",
+    mirror: bool = True,
+    marker: str = "",
+    line_style: str = "-",
+    grid: bool = True,
+    figsize: Tuple[float, float] = (6, 6),
+) -> Tuple[plt.Figure, plt.Axes]:
+    """
+    Create a Nyquist plot (Im H against Re H).
+
+    Parameters:
+    - H: complex transfer function samples, ordered by frequency
+    - title: plot title
+    - mirror: also draw the negative-frequency branch (conjugate) dashed
+    - marker, line_style: plotting styles
+    - grid: show grid on axes
+    - figsize: figure size
+
+    Returns:
+    - fig, ax
+    """
+    real, imag = nyquist_data(np.asarray(H, dtype=complex))
+    fig, ax = plt.subplots(1, 1, figsize=figsize)
+    ax.plot(real, imag, marker=marker, linestyle=line_style, label="ω > 0")
+    if mirror:
+        ax.plot(real, -imag, linestyle="--", color="tab:blue", alpha=0.5, label="ω < 0")
+    ax.axhline(0, color="k", linewidth=0.5)
+    ax.axvline(0, color="k", linewidth=0.5)
+    ax.set_xlabel("Re H")
+    ax.set_ylabel("Im H")
+    ax.set_title(title)
+    ax.set_aspect("equal", adjustable="datalim")
+    ax.grid(grid, linestyle="--", linewidth=0.5)
+    ax.legend()
+    return fig, ax
+
+def nichols_plot(
+    H: Union[np.ndarray, list],
+    title: str = "Nichols Plot",
+    marker: str = "",
+    line_style: str = "-",
+    grid: bool = True,
+    figsize: Tuple[float, float] = (8, 6),
+) -> Tuple[plt.Figure, plt.Axes]:
+    """
+    Create a Nichols plot (magnitude in dB against unwrapped phase in degrees).
+
+    Parameters:
+    - H: complex transfer function samples, ordered by frequency
+    - title: plot title
+    - marker, line_style: plotting styles
+    - grid: show grid on axes
+    - figsize: figure size
+
+    Returns:
+    - fig, ax
+    """
+    phase, mag_db = nichols_data(np.asarray(H, dtype=complex))
+    fig, ax = plt.subplots(1, 1, figsize=figsize)
+    ax.plot(phase, mag_db, marker=marker, linestyle=line_style)
+    ax.set_xlabel("Phase (deg)")
+    ax.set_ylabel("Magnitude (dB)")
+    ax.set_title(title)
+    ax.grid(grid, linestyle="--", linewidth=0.5)
+    return fig, ax
+
+
+def _decade_xticks(ax: plt.Axes, f_lo: float, f_hi: float) -> None:
+    """
+    Set decade ticks with Hz/kHz/MHz labels and x-limits on a log axis.
+    """
+    min_dec = int(np.floor(np.log10(max(f_lo, 1e-30))))
+    max_dec = int(np.ceil(np.log10(f_hi)))
+    if max_dec == min_dec:
+        max_dec += 1
+    xticks = np.logspace(min_dec, max_dec, max_dec - min_dec + 1)
+    ax.set_xscale("log")
+    ax.set_xticks(xticks)
+    ax.set_xlim(xticks[0], xticks[-1])
+
+    def _fmt_xtick(v):
+        if v >= 1e6:
+            return f"{v/1e6:g} MHz"
+        if v >= 1e3:
+            return f"{v/1e3:g} kHz"
+        return f"{int(v)} Hz"
+    ax.set_xticklabels([_fmt_xtick(t) for t in xticks])
+
+
+class LiveBodePlot:
+    """
+    Bode plot for streaming measurements, built once and updated one point at a time.
+
+    Points are inserted in frequency order into preallocated buffers. A point that
+    lands after all previous ones, as in an ordinary sweep, costs a constant amount
+    of work: only its marker and the segment joining it to its neighbour are drawn
+    onto the cached image of the plot and blitted. A point that lands between earlier
+    ones re-renders the lines over the cached background, since the segment it splits
+    is already on screen. Axes, ticks and labels are redrawn only when a new point
+    falls outside the current limits; x-limits grow to whole decades so that happens
+    rarely during a sweep. Non-finite values (failed points passed on as NaN) are
+    stored but leave the limits alone.
+
+    Example:
+    live = LiveBodePlot(title="Low pass sweep")
+    for f in freqs:
+        live.append(f, measure_mag(f), measure_phase(f))
+    """
+
+    def __init__(
+        self,
+        phase: bool = True,
+        title: str = "Bode Plot",
+        xlabel: str = "Frequency (Hz)",
+        mag_label: Optional[str] = None,
+        phase_label: Optional[str] = None,
+        mag_scale: str = "dB",           # "dB" or "linear"
+        marker: str = "o",
+        line_style: str = "-",
+        grid: bool = True,
+        figsize: Tuple[float, float] = (8, 6),
+        capacity: int = 256,
+    ):
+        self.mag_scale = mag_scale
+        if mag_scale == "dB":
+            mag_label = mag_label or "Magnitude (dB)"
+        else:
+            mag_label = mag_label or "Magnitude"
+
+        if phase:
+            self.fig, (self.ax_mag, self.ax_phase) = plt.subplots(
+                2, 1, sharex=True, figsize=figsize, gridspec_kw={"height_ratios": [2, 1]}
+            )
+            self.ax_phase.set_ylabel(phase_label or "Phase (deg)")
+            self.ax_phase.set_xlabel(xlabel)
+            self.ax_phase.grid(grid, which="both", linestyle="--", linewidth=0.5)
+            (self._phase_line,) = self.ax_phase.plot(
+                [], [], marker=marker, linestyle=line_style, color="tab:orange", animated=True
+            )
+            self._x_ax = self.ax_phase
+        else:
+            self.fig, self.ax_mag = plt.subplots(1, 1, figsize=figsize)
+            self.ax_mag.set_xlabel(xlabel)
+            self.ax_phase = None
+            self._phase_line = None
+            self._x_ax = self.ax_mag
+        self.ax_mag.set_ylabel(mag_label)
+        self.ax_mag.set_title(title)
+        self.ax_mag.grid(grid, which="both", linestyle="--", linewidth=0.5)
+        (self._mag_line,) = self.ax_mag.plot([], [], marker=marker, linestyle=line_style, animated=True)
+
+        # the newest point and its segment, drawn on their own for in-order appends
+        self._tails = [
+            line.axes.plot([], [], marker=marker, linestyle=line_style, color=line.get_color(), animated=True)[0]
+            for line in (self._mag_line, self._phase_line) if line is not None
+        ]
+
+        self._freqs = np.empty(capacity)
+        self._mags = np.empty(capacity)      # stored in plot units (dB or linear)
+        self._phase = np.empty(capacity)
+        self._n = 0
+        self._xlim = None
+        self._mag_ylim = None
+        self._phase_ylim = None
+
+        if phase:
+            self.fig.tight_layout()
+        self._background = None
+        self._lines_background = None
+        self._cid = self.fig.canvas.mpl_connect("draw_event", self._on_draw)
+
+    @property
+    def freqs(self) -> np.ndarray:
+        return self._freqs[: self._n]
+
+    @property
+    def mags(self) -> np.ndarray:
+        """Magnitudes in plot units (dB if mag_scale is "dB")."""
+        return self._mags[: self._n]
+
+    @property
+    def phase(self) -> np.ndarray:
+        return self._phase[: self._n]
+
+    def _on_draw(self, event) -> None:
+        # a full draw (first show, resize, limit change) invalidates the cached background
+        canvas = self.fig.canvas
+        if getattr(canvas, "supports_blit", False):
+            self._background = canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_lines()
+        if self._background is not None:
+            self._lines_background = canvas.copy_from_bbox(self.fig.bbox)
+
+    def _draw_lines(self) -> None:
+        self._mag_line.set_data(self.freqs, self.mags)
+        if self._phase_line is not None:
+            self._phase_line.set_data(self.freqs, self.phase)
+        self.fig.draw_artist(self._mag_line)
+        if self._phase_line is not None:
+            self.fig.draw_artist(self._phase_line)
+
+    def _grow(self) -> None:
+        capacity = 2 * self._freqs.size
+        for name in ("_freqs", "_mags", "_phase"):
+            old = getattr(self, name)
+            new = np.empty(capacity)
+            new[: self._n] = old[: self._n]
+            setattr(self, name, new)
+
+    @staticmethod
+    def _expand(lim, value):
+        """
+        Return new (lo, hi) y-limits containing value with 10% headroom, or None if
+        lim already contains it or value is not finite.
+        """
+        if not np.isfinite(value) or (lim is not None and lim[0] <= value <= lim[1]):
+            return None
+        lo, hi = (value, value) if lim is None else (min(lim[0], value), max(lim[1], value))
+        pad = 0.1 * (hi - lo) if hi > lo else max(abs(value) * 0.1, 1.0)
+        return lo - pad, hi + pad
+
+    def append(self, freq: float, mag: float, phase: Optional[float] = None) -> None:
+        """
+        Add one measured point and redraw.
+
+        Parameters:
+        freq (float): Frequency in hertz.
+        mag (float): Magnitude (linear, not dB).
+        phase (float): Phase in degrees. Required if the plot was created with phase=True.
+        """
+        if self._phase_line is not None and phase is None:
+            raise ValueError("phase is required for a plot created with phase=True")
+        if self.mag_scale == "dB":
+            mag = 20.0 * np.log10(max(mag, 1e-30))
+        phase = np.nan if phase is None else phase
+
+        n = self._n
+        if n == self._freqs.size:
+            self._grow()
+        # insert in sorted position; only the tail after i is shifted
+        i = int(np.searchsorted(self._freqs[:n], freq, side="right"))
+        for buf, value in ((self._freqs, freq), (self._mags, mag), (self._phase, phase)):
+            buf[i + 1 : n + 1] = buf[i:n]
+            buf[i] = value
+        self._n = n + 1
+
+        if self._update_limits(freq, mag, phase):
+            self.fig.canvas.draw()
+        elif i == n:
+            self._blit_tail()
+        else:
+            self._blit()
+        self.fig.canvas.flush_events()
+
+    def _update_limits(self, freq: float, mag: float, phase: float) -> bool:
+        changed = False
+        if np.isfinite(freq) and (self._xlim is None or not (self._xlim[0] <= freq <= self._xlim[1])):
+            f_lo = freq if self._xlim is None else min(self._xlim[0], freq)
+            f_hi = freq if self._xlim is None else max(self._xlim[1], freq)
+            _decade_xticks(self._x_ax, f_lo, f_hi)
+            self._xlim = self._x_ax.get_xlim()
+            changed = True
+        new = self._expand(self._mag_ylim, mag)
+        if new is not None:
+            self._mag_ylim = new
+            self.ax_mag.set_ylim(*new)
+            changed = True
+        if self.ax_phase is not None:
+            new = self._expand(self._phase_ylim, phase)
+            if new is not None:
+                self._phase_ylim = new
+                self.ax_phase.set_ylim(*new)
+                changed = True
+        return changed
+
+    def _blit(self) -> None:
+        canvas = self.fig.canvas
+        if self._background is None:
+            canvas.draw()
+            return
+        canvas.restore_region(self._background)
+        self._draw_lines()
+        self._lines_background = canvas.copy_from_bbox(self.fig.bbox)
+        canvas.blit(self.fig.bbox)
+
+    def _blit_tail(self) -> None:
+        """
+        Draw just the last point and the segment to it over the cached lines, so the
+        cost does not grow with the number of points.
+        """
+        canvas = self.fig.canvas
+        if self._lines_background is None:
+            canvas.draw()
+            return
+        canvas.restore_region(self._lines_background)
+        start = max(self._n - 2, 0)
+        for tail, ydata in zip(self._tails, (self._mags, self._phase)):
+            tail.set_data(self._freqs[start : self._n].copy(), ydata[start : self._n].copy())
+            tail.set_markevery([self._n - 1 - start])
+            self.fig.draw_artist(tail)
+        self._lines_background = canvas.copy_from_bbox(self.fig.bbox)
+        canvas.blit(self.fig.bbox)
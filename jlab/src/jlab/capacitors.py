@@ -24,6 +24,7 @@ def series_capacitors(capacitors: Iterable[float]) -> float:
     Returns:
     float: The equivalent capacitance in farads.
     """
+    capacitors = list(capacitors)
     if not capacitors:
         return 0.0
     reciprocal_sum = sum(1.0 / c for c in capacitors if c != 0)
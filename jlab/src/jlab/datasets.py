@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import os
+import struct
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .si_values import parse_si
+
+# On-disk layout of a measurement session, little-endian:
+#   header     magic, version, component count, note length, point count, capacity,
+#              data offset, lowest and highest frequency (64 bytes)
+#   components (name, value) records, 16-byte name + float64
+#   note       utf-8 text
+#   columns    freqs, mags, phase as float64, each reserving `capacity` slots,
+#              starting at a 64-byte aligned offset
+# Appends fill the reserved slots in place and update the header; only running out of
+# capacity moves the mags and phase columns. Queries read just the header.
+DATASET_SUFFIX = ".jlab"
+DATASET_MAGIC = b"JLABDS\x00\x01"
+DATASET_VERSION = 1
+
+_HEADER = struct.Struct("<8sHHIQQQdd")
+_HEADER_SIZE = 64
+_COMPONENT = np.dtype([("name", "S16"), ("value", "<f8")])
+_ALIGN = 64
+_COLUMNS = ("freqs", "mags", "phase")
+
+# ----------- Measurement Dataset Storage -----------
+def write_dataset(
+    path: str,
+    freqs: Union[np.ndarray, list],
+    mags: Union[np.ndarray, list],
+    phase: Optional[Union[np.ndarray, list]] = None,
+    components: Optional[Dict[str, Union[float, str]]] = None,
+    note: str = "",
+    capacity: Optional[int] = None,
+) -> None:
+    """
+    Write a measurement session to a new dataset file, replacing any existing file.
+
+    Parameters:
+    path (str): File path, conventionally ending in DATASET_SUFFIX.
+    freqs (array): Frequencies in hertz.
+    mags (array): Magnitudes (linear Vout/Vin, as for bode_plot).
+    phase (array): Phase in degrees, or None to store NaN.
+    components (dict): Component name -> value, e.g. {"R": "9.98k", "C": 1e-9}.
+        Strings are parsed with parse_si. Names are at most 16 bytes.
+    note (str): Free text such as the lab, date or setup.
+    capacity (int): Points to reserve for later appends, default twice the current length (at least 16).
+
+    Example:
+    write_dataset("lab3_divider.jlab", freqs, vals, components={"R1": "10k", "R2": "15k"})
+    """
+    freqs, mags, phase = _as_columns(freqs, mags, phase)
+    n = freqs.size
+    capacity = max(2 * n, 16) if capacity is None else int(capacity)
+    if capacity < max(n, 1):
+        raise ValueError("capacity must be at least the number of points and at least 1")
+
+    records = np.zeros(len(components or {}), dtype=_COMPONENT)
+    for i, (name, value) in enumerate((components or {}).items()):
+        encoded = name.encode("utf-8")
+        if not encoded or len(encoded) > _COMPONENT["name"].itemsize:
+            raise ValueError(f"component name {name!r} must be 1 to 16 bytes")
+        records[i] = (encoded, parse_si(value))
+    note_bytes = note.encode("utf-8")
+
+    offset = -(-(_HEADER_SIZE + records.nbytes + len(note_bytes)) // _ALIGN) * _ALIGN
+    f_min, f_max = _freq_bounds(freqs)
+    header = _HEADER.pack(
+        DATASET_MAGIC, DATASET_VERSION, records.size, len(note_bytes), n, capacity, offset, f_min, f_max
+    )
+    with open(path, "wb") as fh:
+        fh.write(header.ljust(_HEADER_SIZE, b"\x00"))
+        fh.write(records.tobytes())
+        fh.write(note_bytes)
+        for k, column in enumerate((freqs, mags, phase)):
+            fh.seek(offset + 8 * k * capacity)
+            fh.write(column.tobytes())
+        # the file always spans every reserved slot, so appends within capacity never extend it
+        fh.truncate(offset + 3 * 8 * capacity)
+
+def append_dataset(
+    path: str,
+    freqs: Union[np.ndarray, list],
+    mags: Union[np.ndarray, list],
+    phase: Optional[Union[np.ndarray, list]] = None,
+) -> int:
+    """
+    Append points to an existing dataset file in place. Only the new points and the
+    header are written while they fit the reserved capacity; otherwise the capacity
+    is tripled, which moves the mags and phase columns once. If the append is
+    interrupted, the points already in the file stay intact and readable.
+
+    Parameters:
+    path (str): Dataset file.
+    freqs (array): Frequencies in hertz.
+    mags (array): Magnitudes.
+    phase (array): Phase in degrees, or None to store NaN.
+
+    Returns:
+    int: The number of points in the dataset after the append.
+    """
+    freqs, mags, phase = _as_columns(freqs, mags, phase)
+    info = read_dataset_info(path)
+    n, capacity, offset = info["n_points"], info["capacity"], info["data_offset"]
+    total = n + freqs.size
+
+    # each step leaves a valid file if the process is interrupted: columns are moved
+    # to slots the old layout doesn't use, then the header switches to the new capacity,
+    # and the new points only count once the header's point count is rewritten last
+    with open(path, "r+b") as fh:
+        if total > capacity:
+            # tripling puts the moved mags past the end of the old phase column
+            new_capacity = max(3 * capacity, total)
+            fh.truncate(offset + 3 * 8 * new_capacity)
+            data = np.memmap(fh, dtype="<f8", mode="r+", offset=offset, shape=(3 * new_capacity,))
+            for k in (2, 1):
+                data[k * new_capacity : k * new_capacity + n] = data[k * capacity : k * capacity + n]
+            data.flush()
+            del data
+            capacity = new_capacity
+            _write_header(fh, info, n, capacity, info["f_min"], info["f_max"])
+
+        for k, column in enumerate((freqs, mags, phase)):
+            fh.seek(offset + 8 * (k * capacity + n))
+            fh.write(column.tobytes())
+        fh.flush()
+
+        f_min, f_max = _freq_bounds(freqs)
+        _write_header(fh, info, total, capacity, np.fmin(info["f_min"], f_min), np.fmax(info["f_max"], f_max))
+    return total
+
+def read_dataset_info(path: str) -> Dict[str, object]:
+    """
+    Read the header of a dataset file without touching its columns.
+
+    Parameters:
+    path (str): Dataset file.
+
+    Returns:
+    dict: n_points, capacity, data_offset, f_min, f_max, components (dict) and note.
+    """
+    with open(path, "rb") as fh:
+        raw = fh.read(_HEADER_SIZE)
+        if len(raw) < _HEADER_SIZE or raw[:8] != DATASET_MAGIC:
+            raise ValueError(f"{path!r} is not a jlab dataset")
+        _, version, n_components, note_length, n, capacity, offset, f_min, f_max = _HEADER.unpack_from(raw)
+        if version != DATASET_VERSION:
+            raise ValueError(f"{path!r} has unsupported dataset version {version}")
+        records = np.frombuffer(fh.read(n_components * _COMPONENT.itemsize), dtype=_COMPONENT)
+        note = fh.read(note_length).decode("utf-8")
+    return {
+        "n_points": n,
+        "capacity": capacity,
+        "data_offset": offset,
+        "f_min": f_min,
+        "f_max": f_max,
+        "components": {name.decode("utf-8"): float(value) for name, value in records},
+        "note": note,
+    }
+
+def load_dataset(path: str, mode: str = "r") -> Dict[str, object]:
+    """
+    Load a dataset file. The columns are np.memmap views into the file, so nothing is
+    read until it is used and many sessions can be open at once.
+
+    Parameters:
+    path (str): Dataset file.
+    mode (str): "r" for read-only, "r+" to edit points in place, "c" for copy-on-write.
+
+    Returns:
+    dict: freqs, mags, phase (contiguous float64 arrays), components, note and path.
+
+    Example:
+    data = load_dataset("lab3_lowpass.jlab")
+    bode_plot(data["freqs"], data["mags"], data["phase"])
+    """
+    info = read_dataset_info(path)
+    n, capacity = info["n_points"], info["capacity"]
+    data = np.memmap(path, dtype="<f8", mode=mode, offset=info["data_offset"], shape=(3, capacity))
+    result = {name: data[k, :n] for k, name in enumerate(_COLUMNS)}
+    result.update(components=info["components"], note=info["note"], path=path)
+    return result
+
+def find_datasets(
+    paths: Union[str, Iterable[str]],
+    f_range: Optional[Tuple[Optional[float], Optional[float]]] = None,
+    rtol: float = 0.05,
+    **components,
+) -> List[str]:
+    """
+    Find dataset files by component values and frequency coverage, reading only headers.
+
+    Parameters:
+    paths (str or list): A directory (searched for *DATASET_SUFFIX files) or a list of files.
+    f_range (tuple): (low, high) in hertz; keeps datasets with any points in the range.
+        Either end may be None.
+    rtol (float): Relative tolerance for single component values.
+    **components: Component name -> value or (low, high) range. Values may be SI strings,
+        e.g. R="10k" matches 9.5k to 10.5k at the default tolerance.
+
+    Returns:
+    list: Matching file paths, sorted.
+
+    Example:
+    find_datasets("sessions", f_range=(1e3, 1e5), R=("9k", "11k"), C="1n")
+    """
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [
+            os.path.join(paths, name) for name in os.listdir(paths) if name.endswith(DATASET_SUFFIX)
+        ]
+
+    bounds = {}
+    for name, value in components.items():
+        if isinstance(value, tuple):
+            low, high = value
+            low = -np.inf if low is None else parse_si(low)
+            high = np.inf if high is None else parse_si(high)
+        else:
+            value = parse_si(value)
+            low, high = sorted((value * (1 - rtol), value * (1 + rtol)))
+        bounds[name] = (low, high)
+    f_low, f_high = f_range if f_range is not None else (None, None)
+
+    matches = []
+    for path in paths:
+        info = read_dataset_info(path)
+        if f_low is not None and not info["f_max"] >= f_low:
+            continue
+        if f_high is not None and not info["f_min"] <= f_high:
+            continue
+        values = info["components"]
+        if all(name in values and low <= values[name] <= high for name, (low, high) in bounds.items()):
+            matches.append(path)
+    return sorted(matches)
+
+def _write_header(fh, info: Dict[str, object], n: int, capacity: int, f_min: float, f_max: float) -> None:
+    fh.seek(0)
+    fh.write(_HEADER.pack(
+        DATASET_MAGIC, DATASET_VERSION, len(info["components"]), len(info["note"].encode("utf-8")),
+        n, capacity, info["data_offset"], f_min, f_max,
+    ))
+    fh.flush()
+
+def _as_columns(freqs, mags, phase) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    freqs = np.ascontiguousarray(freqs, dtype="<f8").ravel()
+    mags = np.ascontiguousarray(mags, dtype="<f8").ravel()
+    phase = np.full(freqs.size, np.nan) if phase is None else np.ascontiguousarray(phase, dtype="<f8").ravel()
+    if not freqs.size == mags.size == phase.size:
+        raise ValueError("freqs, mags and phase must have the same length")
+    return freqs, mags, phase
+
+def _freq_bounds(freqs: np.ndarray) -> Tuple[float, float]:
+    if freqs.size == 0 or np.isnan(freqs).all():
+        return np.nan, np.nan
+    return float(np.nanmin(freqs)), float(np.nanmax(freqs))
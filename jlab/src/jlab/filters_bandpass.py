@@ -64,4 +64,22 @@ def bandpass_center_frequency(L: float, C: float) -> float:
     Returns:
     float: The center frequency in hertz.
     """
-    return 1 / (2 * np.pi * np.sqrt(L * C))
\ No newline at end of file
+    return 1 / (2 * np.pi * np.sqrt(L * C))
+
+def bandpass_group_delay(R: float, L: float, C: float, f: float) -> float:
+    """
+    Calculate the group delay of a bandpass RLC filter at frequency f.
+
+    Parameters:
+    R (float): Resistance in ohms.
+    L (float): Inductance in henrys.
+    C (float): Capacitance in farads.
+    f (float): Frequency in hertz.
+
+    Returns:
+    float: The group delay -d(phase)/d(omega) in seconds.
+    """
+    omega = 2 * np.pi * f
+    real = 1 - omega**2 * L * C
+    imag = omega * L / R
+    return (L / R) * (1 + omega**2 * L * C) / (real**2 + imag**2)
\ No newline at end of file
@@ -57,4 +57,19 @@ def highpass_cutoff_frequency(R: float, C: float) -> float:
     Returns:
     float: The cutoff frequency in hertz.
     """
-    return 1 / (2 * np.pi * R * C)
\ No newline at end of file
+    return 1 / (2 * np.pi * R * C)
+
+def highpass_group_delay(R: float, C: float, f: float) -> float:
+    """
+    Calculate the group delay of a highpass RC filter at frequency f.
+
+    Parameters:
+    R (float): Resistance in ohms.
+    C (float): Capacitance in farads.
+    f (float): Frequency in hertz.
+
+    Returns:
+    float: The group delay -d(phase)/d(omega) in seconds.
+    """
+    omega = 2 * np.pi * f
+    return (R * C) / (1 + (omega * R * C) ** 2)
\ No newline at end of file
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+# ----------- Loaded Ladder Calculations -----------
+def ladder_solve(
+    v_in,
+    resistors,
+    loads: Optional[np.ndarray] = None,
+    tap_voltages=0.0,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Solve a resistor ladder: a series chain from v_in to ground (as in voltage_divider)
+    with an optional shunt load from each tap to a tap voltage (ground by default).
+    Nodal analysis gives a tridiagonal system that is solved with the Thomas algorithm
+    in O(n), vectorized across any leading batch axes. With no loads the node voltages
+    are the plain divider values v_in * R_below / R_total.
+
+    Parameters:
+    v_in (float or array): Input voltage in volts, shape (...).
+    resistors (array): Series resistances in ohms, shape (..., n). The last one goes to ground.
+    loads (array): Shunt resistance at each of the n - 1 taps in ohms, shape (..., n - 1).
+        Use np.inf for an unloaded tap. None means no loads.
+    tap_voltages (float or array): Voltage at the far end of each shunt load, shape (..., n - 1).
+        Setting these to bit voltages models an R-2R DAC.
+
+    Returns:
+    tuple: (voltages, series_currents, load_currents)
+        voltages: tap voltages in volts, shape (..., n - 1)
+        series_currents: current down through each series resistor in amperes, shape (..., n)
+        load_currents: current from each tap into its load in amperes, shape (..., n - 1)
+    """
+    g, g_load, v_in, v_tap = _ladder_conductances(v_in, resistors, loads, tap_voltages)
+    v = _ladder_node_voltages(g, g_load, v_in, v_tap)
+
+    nodes = np.concatenate((v_in[None], v, np.zeros((1,) + v_in.shape)), axis=0)
+    series_currents = np.moveaxis((nodes[:-1] - nodes[1:]) * g, 0, -1)
+    load_currents = np.moveaxis((v - v_tap) * g_load, 0, -1)
+    return np.moveaxis(v, 0, -1), series_currents, load_currents
+
+def _ladder_conductances(v_in, resistors, loads, tap_voltages):
+    """
+    Broadcast the ladder inputs to a common batch shape and return conductances,
+    with taps on the leading axis so each sweep step works on one contiguous batch slice.
+    """
+    g = 1.0 / np.asarray(resistors, dtype=float)
+    n = g.shape[-1]
+    if loads is None:
+        g_load = np.zeros(g.shape[:-1] + (n - 1,))
+    else:
+        g_load = 1.0 / np.asarray(loads, dtype=float)
+    v_in = np.asarray(v_in, dtype=float)
+    v_tap = np.asarray(tap_voltages, dtype=float)
+
+    batch = np.broadcast_shapes(g.shape[:-1], g_load.shape[:-1], v_in.shape, v_tap.shape[:-1])
+    g = np.ascontiguousarray(np.moveaxis(np.broadcast_to(g, batch + (n,)), -1, 0))
+    g_load = np.ascontiguousarray(np.moveaxis(np.broadcast_to(g_load, batch + (n - 1,)), -1, 0))
+    v_tap = np.ascontiguousarray(np.moveaxis(np.broadcast_to(v_tap, batch + (n - 1,)), -1, 0))
+    v_in = np.broadcast_to(v_in, batch)
+    return g, g_load, v_in, v_tap
+
+def _ladder_node_voltages(g, g_load, v_in, v_tap):
+    """
+    Assemble and solve the nodal equations, returning tap voltages with taps leading.
+    """
+    # KCL at tap k: -g[k] V[k-1] + (g[k] + g[k+1] + g_load[k]) V[k] - g[k+1] V[k+1] = g_load[k] v_tap[k]
+    diag = g[:-1] + g[1:] + g_load
+    upper = -g[1:-1]
+    rhs = g_load * v_tap
+    if rhs.shape[0]:
+        rhs[0] += g[0] * v_in
+    return _thomas(diag, upper, rhs)
+
+def _thomas(diag, upper, rhs):
+    """
+    Solve a symmetric tridiagonal system along the leading axis with the Thomas algorithm,
+    vectorized over the remaining (batch) axes. upper has one fewer entry than diag.
+    """
+    n = diag.shape[0]
+    x = np.empty(rhs.shape)
+    if n == 0:
+        return x
+    c = np.empty((n - 1,) + rhs.shape[1:])
+    d = np.empty(rhs.shape)
+    d[0] = rhs[0] / diag[0]
+    if n > 1:
+        c[0] = upper[0] / diag[0]
+    for k in range(1, n):
+        m = diag[k] - upper[k - 1] * c[k - 1]
+        if k < n - 1:
+            c[k] = upper[k] / m
+        d[k] = (rhs[k] - upper[k - 1] * d[k - 1]) / m
+    x[-1] = d[-1]
+    for k in range(n - 2, -1, -1):
+        x[k] = d[k] - c[k] * x[k + 1]
+    return x
+
+def r2r_ladder(bits: int, R: float = 10e3) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the series resistors and tap loads of an R-2R ladder for ladder_solve.
+    Each tap has a 2R leg and the chain ends in a 2R termination, so with all tap
+    voltages at ground each tap sits at half the voltage of the one above it.
+
+    Parameters:
+    bits (int): Number of taps.
+    R (float): Unit resistance in ohms.
+
+    Returns:
+    tuple: (resistors, loads), shapes (bits + 1,) and (bits,).
+    """
+    resistors = np.full(bits + 1, float(R))
+    resistors[-1] = 2 * R
+    loads = np.full(bits, 2.0 * R)
+    return resistors, loads
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import numpy as np
+
+from .filters_lowpass import lowpass_gain, lowpass_cutoff_frequency
+from .filters_bandpass import bandpass_gain, bandpass_center_frequency
+
+BOLTZMANN_CONSTANT = 1.380649e-23  # J/K
+ROOM_TEMPERATURE = 300.0  # K
+
+# ----------- Thermal Noise Calculations -----------
+def resistor_noise_density(R, T: float = ROOM_TEMPERATURE):
+    """
+    Calculate the Johnson noise voltage density of a resistor (4kTR).
+
+    Parameters:
+    R (float or array): Resistance in ohms.
+    T (float): Temperature in kelvin.
+
+    Returns:
+    float or array: The noise voltage density in V^2/Hz.
+    """
+    return 4 * BOLTZMANN_CONSTANT * T * np.asarray(R, dtype=float)
+
+def _check_band(f_min: float, f_max: float) -> None:
+    if f_max <= f_min:
+        raise ValueError("f_max must be greater than f_min")
+
+def _noise_frequency_grid(f_min: float, f_max: float, points: int, f_c, bandwidth=None) -> np.ndarray:
+    """
+    Build an integration grid for each component set, shape f_c.shape + (points,),
+    placed around the filter rather than the band: log-spaced from f_c * 1e-6 to
+    f_c * 1e6, where the response is flat or has fallen off. For a resonance, a
+    quarter of the points go to f_c + (bandwidth / 2) tan(theta) with theta uniform,
+    which resolves a Lorentzian peak equally well at any Q, and another quarter to
+    log-spaced offsets from the peak for its 1/f^2 skirts. Points are
+    clipped to [f_min, f_max]; f_min is always the first point so the flat region
+    below the grid is integrated exactly.
+    """
+    _check_band(f_min, f_max)
+    f_c = np.asarray(f_c, dtype=float)[..., None]
+    n_peak = 0 if bandwidth is None else 4 * (points // 8)
+    grids = [np.full(f_c.shape, float(f_min)), f_c * np.geomspace(1e-6, 1e6, points - 1 - n_peak)]
+    if n_peak:
+        half_width = 0.5 * np.asarray(bandwidth, dtype=float)[..., None]
+        theta = np.linspace(-np.pi / 2, np.pi / 2, n_peak // 2 + 2)[1:-1]
+        offsets = np.geomspace(1.0, 1e6, n_peak // 4)
+        grids += [f_c + half_width * np.tan(theta), f_c + half_width * offsets, f_c - half_width * offsets]
+    batch = np.broadcast_shapes(*(grid.shape[:-1] for grid in grids))
+    f = np.concatenate([np.broadcast_to(grid, batch + grid.shape[-1:]) for grid in grids], axis=-1)
+    return np.clip(np.sort(f, axis=-1), f_min, f_max)
+
+def _integrate(y: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Trapezoidal integral of y over the last axis, sampled at x.
+    """
+    return 0.5 * np.sum((y[..., 1:] + y[..., :-1]) * np.diff(x), axis=-1)
+
+def _filter_noise(R, gain_sq, f_min, f_max, T, points, f_c, bandwidth=None):
+    """
+    Integrate 4kTR shaped by |H(f)|^2 and return the RMS noise voltage.
+    gain_sq is called with a frequency grid of shape R.shape + (points,), built around
+    the cutoff or center frequency f_c (and the resonance bandwidth, if any).
+    """
+    f = _noise_frequency_grid(f_min, f_max, points, f_c, bandwidth)
+    density = resistor_noise_density(R, T)[..., None] * gain_sq(f)
+    return np.sqrt(_integrate(density, f))
+
+def voltage_divider_noise(resistors, f_min: float, f_max: float, T: float = ROOM_TEMPERATURE):
+    """
+    Calculate the RMS Johnson noise at each node of a voltage divider, driven by an
+    ideal source. Each resistor's noise is referred to the node through its own gain:
+    resistors above the node see R_below / R_total, resistors below see R_above / R_total.
+
+    Parameters:
+    resistors (array): Resistances in ohms, shape (..., n). Leading axes are independent dividers.
+    f_min (float): Lower edge of the measurement bandwidth in hertz.
+    f_max (float): Upper edge of the measurement bandwidth in hertz.
+    T (float): Temperature in kelvin.
+
+    Returns:
+    array: RMS noise voltage at each node in volts, shape (..., n - 1).
+    """
+    _check_band(f_min, f_max)
+    resistors = np.asarray(resistors, dtype=float)
+    total = resistors.sum(axis=-1, keepdims=True)
+    r_above = np.cumsum(resistors, axis=-1)[..., :-1]
+    r_below = total - r_above
+
+    # gain from resistor j (last axis) to node k (second to last axis)
+    n = resistors.shape[-1]
+    above = np.arange(n)[None, :] <= np.arange(n - 1)[:, None]
+    gain = np.where(above, r_below[..., :, None], r_above[..., :, None]) / total[..., None]
+
+    density = np.sum(gain**2 * resistor_noise_density(resistors, T)[..., None, :], axis=-1)
+    return np.sqrt(density * (f_max - f_min))
+
+def lowpass_noise(R, C, f_min: float = 0.0, f_max: float = 1e9, T: float = ROOM_TEMPERATURE, points: int = 4096):
+    """
+    Calculate the RMS Johnson noise at the output of a lowpass RC filter.
+    Over an unlimited bandwidth this approaches sqrt(kT/C).
+
+    Parameters:
+    R (float or array): Resistance in ohms.
+    C (float or array): Capacitance in farads.
+    f_min (float): Lower edge of the integration band in hertz.
+    f_max (float): Upper edge of the integration band in hertz.
+    T (float): Temperature in kelvin.
+    points (int): Number of frequency points used for the integral.
+
+    Returns:
+    float or array: RMS noise voltage in volts, one per (R, C) pair.
+    """
+    R, C = np.broadcast_arrays(np.asarray(R, dtype=float), np.asarray(C, dtype=float))
+    gain_sq = lambda f: lowpass_gain(R[..., None], C[..., None], f) ** 2
+    return _filter_noise(R, gain_sq, f_min, f_max, T, points, lowpass_cutoff_frequency(R, C))
+
+def highpass_noise(R, C, f_min: float = 0.0, f_max: float = 1e9, T: float = ROOM_TEMPERATURE, points: int = 4096):
+    """
+    Calculate the RMS Johnson noise at the output of a highpass RC filter.
+    The shunt resistor's noise reaches the output through Z_C / (R + Z_C), the
+    lowpass shape rather than highpass_gain, so over an unlimited bandwidth this
+    also approaches sqrt(kT/C).
+
+    Parameters:
+    R (float or array): Resistance in ohms.
+    C (float or array): Capacitance in farads.
+    f_min (float): Lower edge of the integration band in hertz.
+    f_max (float): Upper edge of the integration band in hertz.
+    T (float): Temperature in kelvin.
+    points (int): Number of frequency points used for the integral.
+
+    Returns:
+    float or array: RMS noise voltage in volts, one per (R, C) pair.
+    """
+    R, C = np.broadcast_arrays(np.asarray(R, dtype=float), np.asarray(C, dtype=float))
+    gain_sq = lambda f: lowpass_gain(R[..., None], C[..., None], f) ** 2
+    return _filter_noise(R, gain_sq, f_min, f_max, T, points, lowpass_cutoff_frequency(R, C))
+
+def bandpass_noise(R, L, C, f_min: float = 0.0, f_max: float = 1e9, T: float = ROOM_TEMPERATURE, points: int = 4096):
+    """
+    Calculate the RMS Johnson noise at the output of a bandpass RLC filter.
+    Only the resistor contributes; L and C are treated as ideal.
+
+    Parameters:
+    R (float or array): Resistance in ohms.
+    L (float or array): Inductance in henrys.
+    C (float or array): Capacitance in farads.
+    f_min (float): Lower edge of the integration band in hertz.
+    f_max (float): Upper edge of the integration band in hertz.
+    T (float): Temperature in kelvin.
+    points (int): Number of frequency points used for the integral.
+
+    Returns:
+    float or array: RMS noise voltage in volts, one per (R, L, C) set.
+    """
+    R, L, C = np.broadcast_arrays(
+        np.asarray(R, dtype=float), np.asarray(L, dtype=float), np.asarray(C, dtype=float)
+    )
+    gain_sq = lambda f: bandpass_gain(R[..., None], L[..., None], C[..., None], f) ** 2
+    # the -3 dB bandwidth of this response is 1 / (2 pi R C)
+    return _filter_noise(
+        R, gain_sq, f_min, f_max, T, points, bandpass_center_frequency(L, C), lowpass_cutoff_frequency(R, C)
+    )
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from typing import Iterable
 
+import numpy as np
+
 # ----------- Resistor Calculations -----------
 def parallel_resistors(resistors: Iterable[float]) -> float:
     """
@@ -12,6 +14,7 @@ def parallel_resistors(resistors: Iterable[float]) -> float:
     Returns:
     float: The equivalent resistance in ohms.
     """
+    resistors = list(resistors)
     if not resistors:
         return 0.0
     reciprocal_sum = sum(1.0 / r for r in resistors if r != 0)
@@ -36,12 +39,13 @@ def resistor_power(voltage: float, resistance: float) -> float:
     Calculate the power dissipated by a resistor.
 
     Parameters:
-    voltage (float): The voltage across the resistor in volts.
-    resistance (float): The resistance in ohms.
+    voltage (float or array): The voltage across the resistor in volts.
+    resistance (float or array): The resistance in ohms.
 
     Returns:
-    float: The power dissipated in watts.
+    float or array: The power dissipated in watts.
     """
-    if resistance == 0:
-        return float('inf')  # Infinite power if resistance is zero
-    return (voltage ** 2) / resistance
\ No newline at end of file
+    resistance = np.asarray(resistance, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        power = np.where(resistance == 0, np.inf, np.square(voltage) / resistance)  # Infinite power if resistance is zero
+    return power[()]
\ No newline at end of file
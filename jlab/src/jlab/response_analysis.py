@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import Tuple, Union
+
+import numpy as np
+
+# ----------- Frequency Response Analysis -----------
+def unwrapped_phase(H: Union[np.ndarray, complex], deg: bool = False) -> np.ndarray:
+    """
+    Calculate the continuous phase of a complex frequency response. Unlike the
+    *_delta_angle functions, which use arctan of a ratio and jump by 180 degrees,
+    this follows the phase of H through every quadrant.
+
+    Parameters:
+    H (array): Complex transfer function samples, ordered by frequency along the last axis.
+    deg (bool): Return degrees instead of radians.
+
+    Returns:
+    array: The unwrapped phase.
+    """
+    phase = np.unwrap(np.angle(H), axis=-1)
+    return np.degrees(phase) if deg else phase
+
+def group_delay(freqs: Union[np.ndarray, list], H: np.ndarray) -> np.ndarray:
+    """
+    Calculate the group delay -d(phase)/d(omega) from sampled complex response data,
+    e.g. a measured sweep. Differentiates the unwrapped phase with np.gradient, so
+    the frequency grid may be uneven and no extra evaluations are needed. For the
+    analytic filters prefer lowpass_group_delay and friends.
+
+    Parameters:
+    freqs (array): Frequencies in hertz, increasing along the last axis.
+    H (array): Complex transfer function at freqs.
+
+    Returns:
+    array: The group delay in seconds.
+    """
+    omega = 2 * np.pi * np.asarray(freqs, dtype=float)
+    return -np.gradient(unwrapped_phase(H), omega, axis=-1)
+
+def nyquist_data(H: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate Nyquist plot coordinates of a complex frequency response.
+
+    Parameters:
+    H (array): Complex transfer function samples.
+
+    Returns:
+    tuple: (real, imag) parts of H.
+    """
+    H = np.asarray(H)
+    return H.real, H.imag
+
+def nichols_data(H: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate Nichols plot coordinates of a complex frequency response.
+
+    Parameters:
+    H (array): Complex transfer function samples, ordered by frequency along the last axis.
+
+    Returns:
+    tuple: (phase, mag) with the unwrapped phase in degrees and magnitude in dB.
+    """
+    mag_db = 20.0 * np.log10(np.clip(np.abs(H), a_min=1e-30, a_max=None))
+    return unwrapped_phase(H, deg=True), mag_db
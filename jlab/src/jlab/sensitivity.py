@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .filters_lowpass import lowpass_gain, lowpass_cutoff_frequency
+from .filters_highpass import highpass_gain, highpass_cutoff_frequency
+from .filters_bandpass import bandpass_gain, bandpass_center_frequency
+from .ladder import _ladder_conductances, _ladder_node_voltages, _thomas
+
+# Every function returns exact derivatives of the corresponding model, one array per
+# component, from a single evaluation. With normalized=True they are relative
+# sensitivities (p / y) dy/dp: the % change in the output per % change in the part,
+# which is what to rank when budgeting tolerances.
+
+# ----------- Filter Sensitivities -----------
+def lowpass_gain_sensitivity(R: float, C: float, f: float, normalized: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the derivatives of the lowpass RC gain with respect to R and C.
+
+    Parameters:
+    R (float): Resistance in ohms.
+    C (float): Capacitance in farads.
+    f (float or array): Frequency in hertz.
+    normalized (bool): Return (p / gain) d(gain)/dp instead.
+
+    Returns:
+    tuple: (dG/dR, dG/dC), each shaped like f.
+    """
+    omega = 2 * np.pi * np.asarray(f, dtype=float)
+    x = omega * R * C
+    dG_dx = -x / (1 + x**2) ** 1.5
+    dG_dR = dG_dx * omega * C
+    dG_dC = dG_dx * omega * R
+    if normalized:
+        gain = lowpass_gain(R, C, f)
+        return R * dG_dR / gain, C * dG_dC / gain
+    return dG_dR, dG_dC
+
+def highpass_gain_sensitivity(R: float, C: float, f: float, normalized: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the derivatives of the highpass RC gain with respect to R and C.
+
+    Parameters:
+    R (float): Resistance in ohms.
+    C (float): Capacitance in farads.
+    f (float or array): Frequency in hertz.
+    normalized (bool): Return (p / gain) d(gain)/dp instead.
+
+    Returns:
+    tuple: (dG/dR, dG/dC), each shaped like f.
+    """
+    omega = 2 * np.pi * np.asarray(f, dtype=float)
+    x = omega * R * C
+    dG_dx = 1 / (1 + x**2) ** 1.5
+    dG_dR = dG_dx * omega * C
+    dG_dC = dG_dx * omega * R
+    if normalized:
+        gain = highpass_gain(R, C, f)
+        return R * dG_dR / gain, C * dG_dC / gain
+    return dG_dR, dG_dC
+
+def bandpass_gain_sensitivity(
+    R: float, L: float, C: float, f: float, normalized: bool = False
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate the derivatives of the bandpass RLC gain with respect to R, L and C.
+
+    Parameters:
+    R (float): Resistance in ohms.
+    L (float): Inductance in henrys.
+    C (float): Capacitance in farads.
+    f (float or array): Frequency in hertz.
+    normalized (bool): Return (p / gain) d(gain)/dp instead.
+
+    Returns:
+    tuple: (dG/dR, dG/dL, dG/dC), each shaped like f.
+    """
+    omega = 2 * np.pi * np.asarray(f, dtype=float)
+    # gain = y / sqrt(a^2 + y^2) with y = omega L / R, a = 1 - omega^2 L C
+    y = omega * L / R
+    a = 1 - omega**2 * L * C
+    denom = (a**2 + y**2) ** 1.5
+    dG_dy = a**2 / denom
+    dG_da = -a * y / denom
+    dG_dR = dG_dy * (-y / R)
+    dG_dL = dG_dy * (omega / R) + dG_da * (-(omega**2) * C)
+    dG_dC = dG_da * (-(omega**2) * L)
+    if normalized:
+        gain = bandpass_gain(R, L, C, f)
+        return R * dG_dR / gain, L * dG_dL / gain, C * dG_dC / gain
+    return dG_dR, dG_dL, dG_dC
+
+def lowpass_cutoff_sensitivity(R: float, C: float, normalized: bool = False) -> Tuple[float, float]:
+    """
+    Calculate the derivatives of the lowpass RC cutoff frequency with respect to R and C.
+
+    Parameters:
+    R (float): Resistance in ohms.
+    C (float): Capacitance in farads.
+    normalized (bool): Return (p / f_c) d(f_c)/dp instead (always -1).
+
+    Returns:
+    tuple: (df_c/dR, df_c/dC) in Hz/ohm and Hz/farad.
+    """
+    f_c = lowpass_cutoff_frequency(R, C)
+    if normalized:
+        return -np.ones_like(f_c), -np.ones_like(f_c)
+    return -f_c / R, -f_c / C
+
+def highpass_cutoff_sensitivity(R: float, C: float, normalized: bool = False) -> Tuple[float, float]:
+    """
+    Calculate the derivatives of the highpass RC cutoff frequency with respect to R and C.
+
+    Parameters:
+    R (float): Resistance in ohms.
+    C (float): Capacitance in farads.
+    normalized (bool): Return (p / f_c) d(f_c)/dp instead (always -1).
+
+    Returns:
+    tuple: (df_c/dR, df_c/dC) in Hz/ohm and Hz/farad.
+    """
+    f_c = highpass_cutoff_frequency(R, C)
+    if normalized:
+        return -np.ones_like(f_c), -np.ones_like(f_c)
+    return -f_c / R, -f_c / C
+
+def bandpass_center_sensitivity(L: float, C: float, normalized: bool = False) -> Tuple[float, float]:
+    """
+    Calculate the derivatives of the bandpass RLC center frequency with respect to L and C.
+    The center frequency does not depend on R.
+
+    Parameters:
+    L (float): Inductance in henrys.
+    C (float): Capacitance in farads.
+    normalized (bool): Return (p / f_0) d(f_0)/dp instead (always -1/2).
+
+    Returns:
+    tuple: (df_0/dL, df_0/dC) in Hz/henry and Hz/farad.
+    """
+    f_0 = bandpass_center_frequency(L, C)
+    if normalized:
+        return -0.5 * np.ones_like(f_0), -0.5 * np.ones_like(f_0)
+    return -f_0 / (2 * L), -f_0 / (2 * C)
+
+# ----------- Divider and Ladder Sensitivities -----------
+def voltage_divider_sensitivity(v_in: float, resistors, normalized: bool = False) -> np.ndarray:
+    """
+    Calculate the derivative of every node voltage of an unloaded voltage divider
+    with respect to every resistor.
+
+    Parameters:
+    v_in (float): The input voltage in volts.
+    resistors (array): Resistances in ohms, shape (..., n).
+    normalized (bool): Return (R_j / V_k) dV_k/dR_j instead.
+
+    Returns:
+    array: dV_k/dR_j with shape (..., n - 1, n); node k on the second to last axis.
+    """
+    resistors = np.asarray(resistors, dtype=float)
+    n = resistors.shape[-1]
+    total = resistors.sum(axis=-1, keepdims=True)
+    r_below = (total - np.cumsum(resistors, axis=-1))[..., :-1]
+    below = np.arange(n)[None, :] > np.arange(n - 1)[:, None]
+    jacobian = v_in * (below / total[..., None] - (r_below / total**2)[..., :, None])
+    if normalized:
+        voltages = v_in * r_below / total
+        return jacobian * resistors[..., None, :] / voltages[..., :, None]
+    return jacobian
+
+def ladder_sensitivity(
+    v_in,
+    resistors,
+    loads: Optional[np.ndarray] = None,
+    tap_voltages=0.0,
+    output: int = -1,
+    normalized: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the derivative of one tap voltage of a loaded ladder (see ladder_solve)
+    with respect to every series resistor and every load, using the adjoint method:
+    one forward solve plus one extra tridiagonal solve, however many parts there are.
+
+    Parameters:
+    v_in (float or array): Input voltage in volts, shape (...).
+    resistors (array): Series resistances in ohms, shape (..., n).
+    loads (array): Shunt resistance at each tap in ohms, shape (..., n - 1), or None.
+    tap_voltages (float or array): Voltage at the far end of each load.
+    output (int): Index of the tap whose voltage is differentiated.
+    normalized (bool): Return (R / V_out) dV_out/dR instead.
+
+    Returns:
+    tuple: (dV_out/dR_series, dV_out/dR_load) with shapes (..., n) and (..., n - 1).
+    """
+    g, g_load, v_in, v_tap = _ladder_conductances(v_in, resistors, loads, tap_voltages)
+    v = _ladder_node_voltages(g, g_load, v_in, v_tap)
+
+    # the nodal matrix is symmetric, so the adjoint system reuses it with a unit rhs
+    seed = np.zeros(v.shape)
+    seed[output] = 1.0
+    adjoint = _thomas(g[:-1] + g[1:] + g_load, -g[1:-1], seed)
+
+    # dV_out/dg = -(adj_a - adj_b)(V_a - V_b) for a conductance between nodes a and b,
+    # with the adjoint zero at the fixed input and ground nodes
+    zero = np.zeros((1,) + v_in.shape)
+    nodes = np.concatenate((v_in[None], v, zero), axis=0)
+    adj = np.concatenate((zero, adjoint, zero), axis=0)
+    dV_dg = -(adj[:-1] - adj[1:]) * (nodes[:-1] - nodes[1:])
+    dV_dg_load = -adjoint * (v - v_tap)
+
+    # chain rule to resistances: dV/dR = -g^2 dV/dg, and R dV/dR = -g dV/dg,
+    # so an absent (infinite) load comes out with zero sensitivity
+    if normalized:
+        v_out = v[output]
+        return np.moveaxis(-g * dV_dg / v_out, 0, -1), np.moveaxis(-g_load * dV_dg_load / v_out, 0, -1)
+    return np.moveaxis(-dV_dg * g**2, 0, -1), np.moveaxis(-dV_dg_load * g_load**2, 0, -1)
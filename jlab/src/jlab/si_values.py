@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import csv
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from typing import Dict, Iterable, Iterator, Sequence, Union
+
+import numpy as np
+
+# prefix letter -> power of ten
+SI_PREFIXES = {
+    "f": -15, "p": -12, "n": -9, "u": -6, "\u00b5": -6, "\u03bc": -6, "m": -3,
+    "R": 0, "r": 0, "k": 3, "K": 3, "M": 6, "G": 9, "T": 12,
+}
+
+# unit suffixes stripped before the prefix is read, longest first
+UNIT_SUFFIXES = ("ohms", "ohm", "Ohm", "\u03a9", "\u2126", "Hz", "F", "H", "V", "A")
+
+# exact powers of ten: an integer below 2**53 times/over one of these rounds once,
+# so the fast path matches float() on the equivalent literal
+_POW10_FLOAT = np.array([float(10**k) for k in range(23)])
+
+# ----------- Component Value Parsing -----------
+def parse_si(values: Union[str, float, Sequence, np.ndarray]):
+    """
+    Parse component values written in engineering notation into float64.
+
+    Accepts a trailing SI prefix with an optional unit ("10.07k", "991p", "9.96kΩ",
+    "10nF", "9.97mH"), the BOM style with the prefix as decimal point ("4k7", "2R2"),
+    and plain numbers ("1e-9"). Empty strings become NaN; anything else that is not
+    a value, such as a bare unit ("F") or two prefixes ("1k5k"), raises ValueError.
+    The column is parsed as a 2-D array of code points, one numpy pass per character
+    position rather than a Python loop per value, and "991p" gives exactly the same
+    float as 991e-12.
+
+    Parameters:
+    values (str or array): One value or a column of values.
+
+    Returns:
+    float or array: The values in base units, as float64.
+    """
+    arr = np.asarray(values)
+    if arr.dtype.kind in "biuf":
+        return arr.astype(np.float64)[()]
+    arr = arr.astype(str)
+    shape = arr.shape
+
+    # one spare column keeps every row zero-terminated
+    width = max(arr.dtype.itemsize // 4, 1)
+    arr = arr.ravel().astype(f"<U{width + 1}")
+    codes = arr.view(np.uint32).reshape(arr.size, width + 1)
+    if (codes == ord(" ")).any():
+        spaced = np.flatnonzero((codes == ord(" ")).any(axis=1))
+        arr[spaced] = np.char.replace(arr[spaced], " ", "")
+    lengths = np.char.str_len(arr)
+    rows = np.arange(arr.size)
+
+    # strip one unit suffix per entry, checking only entries ending in a unit letter
+    last = codes[rows, np.maximum(lengths - 1, 0)]
+    candidates = np.flatnonzero(np.isin(last, [ord(unit[-1]) for unit in UNIT_SUFFIXES]))
+    # a unit with no number ("F") is a typo, not an empty cell
+    invalid = np.zeros(arr.size, dtype=bool)
+    stripped = np.zeros(candidates.size, dtype=bool)
+    for unit in UNIT_SUFFIXES:
+        mask = ~stripped & np.char.endswith(arr[candidates], unit)
+        if mask.any():
+            hit = candidates[mask]
+            for i in range(1, len(unit) + 1):
+                codes[hit, lengths[hit] - i] = 0
+            lengths[hit] -= len(unit)
+            invalid[hit[lengths[hit] == 0]] = True
+            stripped |= mask
+
+    # from here on work column-wise, (position, entry), so every pass is contiguous
+    columns = np.ascontiguousarray(codes.T)
+    last = columns[np.maximum(lengths - 1, 0), rows]
+    # entries with a letter between two digits and no "." use it as the decimal point ("4k7")
+    digit = columns - np.uint32(ord("0")) < 10
+    inner = digit[:-2] & digit[2:] & (columns[1:-1] > ord("9"))
+    inner_rows = np.flatnonzero(inner.any(axis=0) & ~(columns == ord(".")).any(axis=0))
+    inner_cols = np.argmax(inner[:, inner_rows], axis=0) + 1 if inner_rows.size else inner_rows
+    inner_codes = columns[inner_cols, inner_rows]
+
+    exp10 = np.zeros(arr.size, dtype=np.int64)
+    has_trailing = np.zeros(arr.size, dtype=bool)
+    has_inner = np.zeros(arr.size, dtype=bool)
+    for prefix, exp in SI_PREFIXES.items():
+        code = ord(prefix)
+        trailing = np.flatnonzero((last == code) & (lengths > 1))
+        columns[lengths[trailing] - 1, trailing] = 0
+        lengths[trailing] -= 1
+        exp10[trailing] = exp
+        has_trailing[trailing] = True
+        found = inner_codes == code
+        columns[inner_cols[found], inner_rows[found]] = ord(".")
+        exp10[inner_rows[found]] = exp
+        has_inner[inner_rows[found]] = True
+    # two prefixes ("1k5k") would otherwise have one silently ignored
+    invalid |= has_trailing & has_inner
+
+    result = _parse_decimal(columns, lengths, exp10)
+
+    # anything outside the fast path (nan, inf, >15 digits, huge exponents, typos)
+    slow = np.flatnonzero((np.isnan(result) & (lengths > 0)) | invalid)
+    originals = np.asarray(values).ravel()
+    for i in slow:
+        if invalid[i]:
+            raise ValueError(f"could not parse component value {str(originals[i])!r}")
+        try:
+            text = "".join(map(chr, columns[: lengths[i], i]))
+            result[i] = float(Decimal(text).scaleb(int(exp10[i])))
+        except InvalidOperation:
+            try:
+                result[i] = float(str(originals[i]))
+            except ValueError:
+                raise ValueError(f"could not parse component value {str(originals[i])!r}") from None
+    return result.reshape(shape)[()]
+
+def _parse_decimal(columns: np.ndarray, lengths: np.ndarray, exp10: np.ndarray) -> np.ndarray:
+    """
+    Convert entries stored column-wise as code points, [+-]digits[.digits][e[+-]digits],
+    to float64 times 10**exp10. One vectorized step per character position.
+    Entries that don't fit the exact fast path come back NaN.
+    """
+    n = columns.shape[1]
+    mant = np.zeros(n, dtype=np.int64)
+    expo = np.zeros(n, dtype=np.int64)
+    n_mant = np.zeros(n, dtype=np.int64)
+    n_exp = np.zeros(n, dtype=np.int64)
+    decimals = np.zeros(n, dtype=np.int64)
+    seen_dot = np.zeros(n, dtype=bool)
+    seen_e = np.zeros(n, dtype=bool)
+    after_e = np.zeros(n, dtype=bool)
+    exp_negative = np.zeros(n, dtype=bool)
+    bad = np.zeros(n, dtype=bool)
+    negative = columns[0] == ord("-")
+
+    for j in range(int(lengths.max(initial=0))):
+        c = columns[j]
+        active = lengths > j
+        d = c - np.uint32(ord("0"))
+        is_digit = active & (d < 10)
+        d = d.astype(np.int64)
+
+        in_mant = is_digit & ~seen_e
+        mant = np.where(in_mant, mant * 10 + d, mant)
+        n_mant += in_mant
+        decimals += in_mant & seen_dot
+        in_exp = is_digit & seen_e
+        expo = np.where(in_exp, expo * 10 + d, expo)
+        n_exp += in_exp
+
+        is_dot = active & (c == ord("."))
+        bad |= is_dot & (seen_dot | seen_e)
+        seen_dot |= is_dot
+        is_e = active & ((c == ord("e")) | (c == ord("E")))
+        bad |= is_e & (seen_e | (n_mant == 0))
+        is_sign = active & ((c == ord("-")) | (c == ord("+")))
+        if j > 0:
+            bad |= is_sign & ~after_e
+            exp_negative |= is_sign & (c == ord("-"))
+        after_e = is_e
+        seen_e |= is_e
+        bad |= active & ~(is_digit | is_dot | is_e | is_sign)
+
+    power = exp10 - decimals + np.where(exp_negative, -expo, expo)
+    ok = (~bad & (n_mant >= 1) & (n_mant <= 15) & (n_exp <= 3) & (seen_e <= (n_exp > 0))
+          & (np.abs(power) <= 22))
+    scale = _POW10_FLOAT[np.minimum(np.abs(power), 22)]
+    mant = mant.astype(np.float64)
+    result = np.where(power >= 0, mant * scale, mant / scale)
+    result = np.where(negative, -result, result)
+    return np.where(ok, result, np.nan)
+
+def iter_bom(
+    path: str,
+    value_columns: Iterable[str] = ("Value",),
+    chunksize: int = 100_000,
+    delimiter: str = ",",
+) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Read a BOM CSV file with a header row in chunks, so memory use is bounded by
+    the chunk size rather than the file size.
+
+    Parameters:
+    path (str): Path to the CSV file.
+    value_columns (list): Columns parsed with parse_si into float64. Other columns stay strings.
+    chunksize (int): Rows per chunk.
+    delimiter (str): Field delimiter.
+
+    Returns:
+    iterator: Dicts mapping column name -> array for each chunk.
+    """
+    value_columns = set(value_columns)
+    with open(path, newline="", encoding="utf-8-sig") as fh:
+        reader = csv.reader(fh, delimiter=delimiter)
+        header = [name.strip() for name in next(reader)]
+        missing = value_columns.difference(header)
+        if missing:
+            raise KeyError(f"columns not in BOM header: {sorted(missing)}")
+        while True:
+            rows = list(islice(reader, chunksize))
+            if not rows:
+                return
+            columns = zip(*(row + [""] * (len(header) - len(row)) for row in rows))
+            yield {
+                name: parse_si(np.array(col)) if name in value_columns else np.array(col)
+                for name, col in zip(header, columns)
+            }
+
+def read_bom(
+    path: str,
+    value_columns: Iterable[str] = ("Value",),
+    chunksize: int = 100_000,
+    delimiter: str = ",",
+) -> Dict[str, np.ndarray]:
+    """
+    Read a whole BOM CSV file into columns, parsing it chunk by chunk.
+
+    Parameters:
+    path (str): Path to the CSV file.
+    value_columns (list): Columns parsed with parse_si into float64. Other columns stay strings.
+    chunksize (int): Rows per chunk.
+    delimiter (str): Field delimiter.
+
+    Returns:
+    dict: Column name -> array. Value columns can be passed straight to jlab functions.
+    """
+    chunks = list(iter_bom(path, value_columns, chunksize, delimiter))
+    if not chunks:
+        return {}
+    return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from .filters_lowpass import lowpass_transfer_function
+from .filters_highpass import highpass_transfer_function
+from .filters_bandpass import bandpass_transfer_function
+
+STREAM_LIMIT = 2**24  # bytes per line, large enough for long waveform records
+
+# ----------- Simulated Function Generator + Scope -----------
+class SimulatedInstrument:
+    """
+    A function generator and two-channel scope served over a line-based, SCPI-style
+    TCP protocol. CH1 is the generator output and CH2 is the filter output, computed
+    from a model transfer function, so a sweep can be run and benchmarked offline.
+    Each connection has its own generator/scope state. Records are synthesized and
+    formatted in worker threads and replies are sent in order from an output queue,
+    so a pipelined client overlaps one record's transfer with the next settle.
+
+    Commands (one per line; queries answer with one line):
+    *IDN?                 identification string
+    FREQ <hz> / FREQ?     generator frequency, setting it restarts the settle timer
+    VOLT <v> / VOLT?      generator amplitude in volts
+    WAV:POIN <n> / ?      samples per record
+    ACQ:PER <n> / ?       signal periods per record (sets the sample rate)
+    DIG                   wait for settling, then capture both channels
+    ACQ:SRAT?             sample rate of the last capture in samples/s
+    WAV:DATA? CH1|CH2     comma-separated samples of the last capture
+    Unknown commands and invalid settings (e.g. a non-positive FREQ, WAV:POIN or
+    ACQ:PER) answer "ERR <command>" and leave the state unchanged.
+
+    Parameters:
+    response (callable): f -> complex transfer function H(f).
+    noise (float): Standard deviation of additive noise on each channel in volts.
+    settle_time (float): Seconds to wait after a frequency change before capturing.
+    acquire_time (float): Seconds taken by each capture.
+    seed (int): Seed for the noise generator.
+    """
+
+    def __init__(
+        self,
+        response: Callable[[float], complex],
+        noise: float = 0.0,
+        settle_time: float = 0.0,
+        acquire_time: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.response = response
+        self.noise = noise
+        self.settle_time = settle_time
+        self.acquire_time = acquire_time
+        self._rng = np.random.default_rng(seed)
+        self._server = None
+        self._connections = {}  # handler task -> writer
+
+    @classmethod
+    def lowpass(cls, R: float, C: float, **kwargs) -> "SimulatedInstrument":
+        """Instrument measuring a lowpass RC filter (|H| is lowpass_gain)."""
+        return cls(lambda f: lowpass_transfer_function(R, C, f), **kwargs)
+
+    @classmethod
+    def highpass(cls, R: float, C: float, **kwargs) -> "SimulatedInstrument":
+        """Instrument measuring a highpass RC filter (|H| is highpass_gain)."""
+        return cls(lambda f: highpass_transfer_function(R, C, f), **kwargs)
+
+    @classmethod
+    def bandpass(cls, R: float, L: float, C: float, **kwargs) -> "SimulatedInstrument":
+        """Instrument measuring a bandpass RLC filter (|H| is bandpass_gain)."""
+        return cls(lambda f: bandpass_transfer_function(R, L, C, f), **kwargs)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> Tuple[str, int]:
+        """
+        Start serving. Port 0 picks a free port.
+
+        Returns:
+        tuple: The (host, port) the server is listening on.
+        """
+        self._server = await asyncio.start_server(self._handle, host, port, limit=STREAM_LIMIT)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            # closing each connection ends its handler, which then finishes on its own
+            for writer in list(self._connections.values()):
+                writer.close()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "SimulatedInstrument":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._server.sockets[0].getsockname()[:2]
+
+    def _capture(self, freq: float, volt: float, points: int, periods: float, noise1, noise2):
+        """
+        Synthesize one record of both channels. Runs in a worker thread.
+        """
+        srate = freq * points / periods
+        t = np.arange(points) / srate
+        h = complex(self.response(freq))
+        ch1 = volt * np.sin(2 * np.pi * freq * t)
+        ch2 = volt * abs(h) * np.sin(2 * np.pi * freq * t + np.angle(h))
+        if noise1 is not None:
+            ch1 = ch1 + noise1
+            ch2 = ch2 + noise2
+        return srate, ch1, ch2
+
+    @staticmethod
+    def _format_record(samples: np.ndarray) -> str:
+        return ",".join(map("{:.7g}".format, samples))
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        loop = asyncio.get_running_loop()
+        state = {"freq": 1e3, "volt": 1.0, "points": 1000, "periods": 10.0, "settled_at": 0.0,
+                 "srate": 0.0, "CH1": np.empty(0), "CH2": np.empty(0)}
+        settings = {"FREQ": ("freq", float), "VOLT": ("volt", float),
+                    "WAV:POIN": ("points", int), "ACQ:PER": ("periods", float)}
+
+        # Like a real instrument's output queue, replies are sent in order by a separate
+        # task while later commands keep executing: once a record has been captured, the
+        # next FREQ starts settling while the record is still being formatted and sent.
+        replies: asyncio.Queue = asyncio.Queue()
+
+        async def send_replies():
+            while True:
+                reply = await replies.get()
+                if reply is None:
+                    return
+                writer.write((await reply).encode() + b"\n")
+                await writer.drain()
+
+        def queue(reply: str) -> None:
+            done = loop.create_future()
+            done.set_result(reply)
+            replies.put_nowait(done)
+
+        sender = asyncio.ensure_future(send_replies())
+        self._connections[asyncio.current_task()] = writer
+        try:
+            while not sender.done():
+                line = await reader.readline()
+                if not line:
+                    break
+                command, _, arg = line.decode().strip().partition(" ")
+                command = command.upper()
+                if command == "*IDN?":
+                    queue("JLAB,SIMULATED,0,0.1")
+                elif command in settings:
+                    key, kind = settings[command]
+                    try:
+                        value = kind(arg)
+                    except ValueError:
+                        value = None
+                    # frequency, record length and periods must be positive and finite
+                    if value is None or (key != "volt" and not 0 < value < np.inf):
+                        queue(f"ERR {line.decode().strip()}")
+                    else:
+                        state[key] = value
+                        if key == "freq":
+                            state["settled_at"] = loop.time() + self.settle_time
+                elif command.endswith("?") and command[:-1] in settings:
+                    queue(repr(state[settings[command[:-1]][0]]))
+                elif command == "DIG":
+                    await asyncio.sleep(max(0.0, state["settled_at"] - loop.time()) + self.acquire_time)
+                    # noise is drawn here, on the loop, since the generator is shared by all connections
+                    noise = [None, None]
+                    if self.noise:
+                        noise = [self._rng.normal(0.0, self.noise, state["points"]) for _ in range(2)]
+                    state["srate"], state["CH1"], state["CH2"] = await loop.run_in_executor(
+                        None, self._capture, state["freq"], state["volt"], state["points"], state["periods"], *noise
+                    )
+                elif command == "ACQ:SRAT?":
+                    queue(repr(state["srate"]))
+                elif command == "WAV:DATA?" and arg.upper() in ("CH1", "CH2"):
+                    replies.put_nowait(loop.run_in_executor(None, self._format_record, state[arg.upper()]))
+                else:
+                    queue(f"ERR {line.decode().strip()}")
+            replies.put_nowait(None)
+            await sender
+        except (ConnectionResetError, BrokenPipeError):
+            pass
+        finally:
+            sender.cancel()
+            writer.close()
+            self._connections.pop(asyncio.current_task(), None)
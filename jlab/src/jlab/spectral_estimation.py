@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+from typing import Callable, Iterable, Optional, Tuple, Union
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .response_analysis import unwrapped_phase
+
+# ----------- Broadband Frequency Response Estimation -----------
+def log_chirp(f0: float, f1: float, duration: float, sample_rate: float, amplitude: float = 1.0) -> np.ndarray:
+    """
+    Generate a logarithmic (exponential) sine sweep from f0 to f1.
+
+    Parameters:
+    f0 (float): Start frequency in hertz.
+    f1 (float): End frequency in hertz.
+    duration (float): Sweep length in seconds.
+    sample_rate (float): Sample rate in samples per second.
+    amplitude (float): Peak amplitude in volts.
+
+    Returns:
+    array: The excitation samples.
+    """
+    t = np.arange(int(round(duration * sample_rate))) / sample_rate
+    rate = np.log(f1 / f0) / duration
+    return amplitude * np.sin(2 * np.pi * f0 * np.expm1(rate * t) / rate)
+
+class WelchEstimator:
+    """
+    Streaming Welch-style estimate of a frequency response H(f) from an excitation x
+    (a chirp or noise) and the recorded output y.
+
+    Feed the recording in chunks of any size with update(). Complete segments are
+    windowed, FFT'd and added to running cross- and auto-spectra, and only the
+    samples of the last partial segment are kept. Memory stays at a few segments
+    however long the recording is.
+
+    H = Pxy / Pxx (the H1 estimator), coherence = |Pxy|^2 / (Pxx Pyy).
+
+    Example:
+    est = WelchEstimator(sample_rate=1e6, nperseg=8192)
+    for x_chunk, y_chunk in stream:
+        est.update(x_chunk, y_chunk)
+    bode_plot(*est.bode_data())
+    """
+
+    def __init__(
+        self,
+        sample_rate: float,
+        nperseg: int = 4096,
+        noverlap: Optional[int] = None,
+        window: Optional[np.ndarray] = None,
+        detrend: bool = True,
+    ):
+        self.sample_rate = float(sample_rate)
+        self.nperseg = int(nperseg)
+        noverlap = self.nperseg // 2 if noverlap is None else int(noverlap)
+        if not 0 <= noverlap < self.nperseg:
+            raise ValueError("noverlap must be in [0, nperseg)")
+        self.hop = self.nperseg - noverlap
+        self.window = np.hanning(self.nperseg + 1)[:-1] if window is None else np.asarray(window, dtype=float)
+        if self.window.shape != (self.nperseg,):
+            raise ValueError("window must have nperseg samples")
+        self.detrend = detrend
+        self.freqs = np.fft.rfftfreq(self.nperseg, 1.0 / self.sample_rate)
+        self.segments = 0
+        self._sxx = np.zeros(self.freqs.size)
+        self._syy = np.zeros(self.freqs.size)
+        self._sxy = np.zeros(self.freqs.size, dtype=complex)
+        self._x_tail = np.empty(0)
+        self._y_tail = np.empty(0)
+
+    def update(self, x, y, block_segments: int = 64) -> None:
+        """
+        Add a chunk of the recording. x and y must be the same length.
+
+        Parameters:
+        x (array): Excitation samples.
+        y (array): Output samples.
+        block_segments (int): Segments transformed per vectorized FFT call; bounds working memory.
+        """
+        if len(x) != len(y):
+            raise ValueError("x and y must have the same length")
+        step = block_segments * self.hop
+        for start in range(0, len(x), step):
+            # slicing first keeps np.memmap inputs from being read all at once
+            self._x_tail = np.concatenate((self._x_tail, np.asarray(x[start : start + step], dtype=float)))
+            self._y_tail = np.concatenate((self._y_tail, np.asarray(y[start : start + step], dtype=float)))
+            self._consume()
+
+    def _consume(self) -> None:
+        n = self._x_tail.size
+        if n < self.nperseg:
+            return
+        count = (n - self.nperseg) // self.hop + 1
+        xs = sliding_window_view(self._x_tail, self.nperseg)[:: self.hop][:count]
+        ys = sliding_window_view(self._y_tail, self.nperseg)[:: self.hop][:count]
+        if self.detrend:
+            xs = xs - xs.mean(axis=1, keepdims=True)
+            ys = ys - ys.mean(axis=1, keepdims=True)
+        X = np.fft.rfft(xs * self.window, axis=1)
+        Y = np.fft.rfft(ys * self.window, axis=1)
+        self._sxx += np.einsum("ij,ij->j", X.real, X.real) + np.einsum("ij,ij->j", X.imag, X.imag)
+        self._syy += np.einsum("ij,ij->j", Y.real, Y.real) + np.einsum("ij,ij->j", Y.imag, Y.imag)
+        self._sxy += np.einsum("ij,ij->j", X.conj(), Y)
+        self.segments += count
+        used = count * self.hop
+        self._x_tail = self._x_tail[used:].copy()
+        self._y_tail = self._y_tail[used:].copy()
+
+    def _density(self, s: np.ndarray) -> np.ndarray:
+        if self.segments == 0:
+            raise ValueError("no complete segments yet")
+        scale = 1.0 / (self.sample_rate * np.sum(self.window**2) * self.segments)
+        s = s * scale
+        # one-sided: double everything but DC (and Nyquist for even nperseg)
+        s[1 : self.freqs.size - (self.nperseg % 2 == 0)] *= 2
+        return s
+
+    @property
+    def pxx(self) -> np.ndarray:
+        """Power spectral density of x in V^2/Hz."""
+        return self._density(self._sxx)
+
+    @property
+    def pyy(self) -> np.ndarray:
+        """Power spectral density of y in V^2/Hz."""
+        return self._density(self._syy)
+
+    @property
+    def pxy(self) -> np.ndarray:
+        """Cross spectral density conj(X) Y in V^2/Hz."""
+        return self._density(self._sxy)
+
+    def transfer_function(self) -> np.ndarray:
+        """
+        Returns:
+        array: Complex H1 estimate Pxy / Pxx at self.freqs.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self._sxy / self._sxx
+
+    def coherence(self) -> np.ndarray:
+        """
+        Returns:
+        array: Magnitude-squared coherence in [0, 1] at self.freqs. Always 1 for a single segment.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.abs(self._sxy) ** 2 / (self._sxx * self._syy)
+
+    def bode_data(self, min_coherence: float = 0.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Magnitude and phase ready for bode_plot, without the DC bin and bins below min_coherence.
+
+        Returns:
+        tuple: (freqs, mags, phase) with phase in degrees.
+        """
+        H = self.transfer_function()
+        keep = (self.freqs > 0) & (self.coherence() >= min_coherence)
+        phase = unwrapped_phase(H[1:], deg=True)
+        return self.freqs[keep], np.abs(H[keep]), phase[keep[1:]]
+
+def estimate_frequency_response(
+    x: Union[np.ndarray, Iterable],
+    y: Optional[np.ndarray] = None,
+    sample_rate: float = 1.0,
+    nperseg: int = 4096,
+    noverlap: Optional[int] = None,
+    window: Optional[np.ndarray] = None,
+    chunk_size: int = 1 << 20,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Estimate H(f) and coherence from a broadband excitation and the recorded output.
+
+    Parameters:
+    x (array or iterable): Excitation samples (an array or np.memmap), or an iterable
+        of (x_chunk, y_chunk) pairs when y is None.
+    y (array): Output samples, same length as x.
+    sample_rate (float): Sample rate in samples per second.
+    nperseg (int): Segment length; sets the frequency resolution sample_rate / nperseg.
+    noverlap (int): Overlap between segments, default nperseg // 2.
+    window (array): Window of nperseg samples, default periodic Hann.
+    chunk_size (int): Samples read at a time from array inputs.
+
+    Returns:
+    tuple: (freqs, H, coherence)
+    """
+    estimator = WelchEstimator(sample_rate, nperseg, noverlap, window)
+    if y is None:
+        for x_chunk, y_chunk in x:
+            estimator.update(x_chunk, y_chunk)
+    else:
+        if len(x) != len(y):
+            raise ValueError("x and y must have the same length")
+        for start in range(0, len(x), chunk_size):
+            estimator.update(x[start : start + chunk_size], y[start : start + chunk_size])
+    return estimator.freqs, estimator.transfer_function(), estimator.coherence()
+
+def compare_to_model(
+    freqs: np.ndarray,
+    H: np.ndarray,
+    model: Callable[[np.ndarray], np.ndarray],
+    coherence: Optional[np.ndarray] = None,
+    min_coherence: float = 0.9,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compare an estimated response with an analytic model, e.g.
+    lambda f: lowpass_transfer_function(R, C, f).
+
+    Parameters:
+    freqs (array): Frequencies in hertz.
+    H (array): Estimated complex response at freqs.
+    model (callable): f -> complex model response.
+    coherence (array): Coherence at freqs; bins below min_coherence become NaN.
+    min_coherence (float): Coherence threshold.
+
+    Returns:
+    tuple: (mag_error, phase_error) in dB and degrees, estimate minus model.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.asarray(H) / model(np.asarray(freqs, dtype=float))
+        mag_error = 20.0 * np.log10(np.abs(ratio))
+    phase_error = np.degrees(np.angle(ratio))
+    if coherence is not None:
+        bad = ~(np.asarray(coherence) >= min_coherence)
+        mag_error = np.where(bad, np.nan, mag_error)
+        phase_error = np.where(bad, np.nan, phase_error)
+    return mag_error, phase_error
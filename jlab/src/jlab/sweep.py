@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Callable, Optional, Tuple, Union
+
+import numpy as np
+
+from .simulated_instrument import STREAM_LIMIT, SimulatedInstrument
+
+# ----------- Automated Frequency Sweeps -----------
+def complex_gain(freq: float, sample_rate: float, ch1, ch2) -> complex:
+    """
+    Calculate the complex gain CH2/CH1 at a known frequency by projecting both
+    records onto exp(-j 2 pi f t) (a software lock-in). Records should span a whole
+    number of periods.
+
+    Parameters:
+    freq (float): Excitation frequency in hertz.
+    sample_rate (float): Sample rate in samples per second.
+    ch1 (array): Input waveform samples.
+    ch2 (array): Output waveform samples.
+
+    Returns:
+    complex: H = V_out / V_in. abs() gives the gain, np.angle() the phase in radians.
+    """
+    ch1 = np.asarray(ch1, dtype=float)
+    ch2 = np.asarray(ch2, dtype=float)
+    ref = np.exp(-2j * np.pi * freq * np.arange(ch1.size) / sample_rate)
+    return (ch2 @ ref) / (ch1 @ ref)
+
+def _parse_record(line: bytes) -> np.ndarray:
+    return np.fromstring(line, sep=",")
+
+def _measure(freq: float, srate: bytes, ch1: bytes, ch2: bytes) -> complex:
+    return complex_gain(freq, float(srate), _parse_record(ch1), _parse_record(ch2))
+
+async def _readline(reader: asyncio.StreamReader) -> bytes:
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("instrument closed the connection")
+    if line.startswith(b"ERR"):
+        raise RuntimeError(f"instrument error: {line.decode().strip()}")
+    return line.strip()
+
+def _scpi(*commands: str) -> bytes:
+    return "".join(c + "\n" for c in commands).encode()
+
+async def sweep(
+    host: str,
+    port: int,
+    freqs: Union[np.ndarray, list],
+    amplitude: float = 1.0,
+    points: int = 1000,
+    periods: float = 10.0,
+    depth: int = 4,
+    on_point: Optional[Callable[[float, float, float], None]] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Run a frequency sweep against a function generator + scope speaking the
+    protocol of SimulatedInstrument.
+
+    Commands for up to `depth` frequencies are written ahead without waiting for
+    replies, so the instrument settles on the next frequency while earlier records
+    are still being transferred. Parsing and gain/phase computation run in a worker
+    thread, overlapping with acquisition. depth=1 gives a plain serial sweep.
+
+    Parameters:
+    host (str): Instrument host.
+    port (int): Instrument port.
+    freqs (array): Frequencies to measure in hertz.
+    amplitude (float): Generator amplitude in volts.
+    points (int): Samples per record.
+    periods (float): Signal periods per record.
+    depth (int): Number of frequencies in flight.
+    on_point (callable): Called as on_point(freq, mag, phase_deg) as each point
+        finishes (not necessarily in frequency order), e.g. LiveBodePlot.append.
+
+    Returns:
+    tuple: (freqs, mags, phase) arrays, phase in degrees, ready for bode_plot.
+    """
+    if depth < 1:
+        raise ValueError("depth must be at least 1")
+    if points < 1:
+        raise ValueError("points must be at least 1")
+    freqs = np.asarray(freqs, dtype=float)
+    mags = np.full(freqs.size, np.nan)
+    phase = np.full(freqs.size, np.nan)
+    loop = asyncio.get_running_loop()
+    window = asyncio.Semaphore(depth)
+
+    reader, writer = await asyncio.open_connection(host, port, limit=STREAM_LIMIT)
+    writer.write(_scpi(f"VOLT {amplitude:.17g}", f"WAV:POIN {int(points)}", f"ACQ:PER {periods:.17g}"))
+
+    async def send():
+        for f in freqs:
+            await window.acquire()
+            writer.write(_scpi(f"FREQ {f:.17g}", "DIG", "ACQ:SRAT?", "WAV:DATA? CH1", "WAV:DATA? CH2"))
+            await writer.drain()
+
+    async def analyse(k, record):
+        h = await loop.run_in_executor(None, _measure, freqs[k], *record)
+        mags[k] = abs(h)
+        phase[k] = np.degrees(np.angle(h))
+        if on_point is not None:
+            on_point(freqs[k], mags[k], phase[k])
+
+    async def receive():
+        tasks = []
+        for k in range(freqs.size):
+            record = [await _readline(reader) for _ in range(3)]
+            window.release()
+            tasks.append(asyncio.ensure_future(analyse(k, record)))
+        await asyncio.gather(*tasks)
+
+    tasks = [asyncio.ensure_future(send()), asyncio.ensure_future(receive())]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        # if one side fails the other may still be waiting on the window or a reply
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (ConnectionResetError, BrokenPipeError):
+            pass
+    return freqs, mags, phase
+
+def run_sweep(host: str, port: int, freqs: Union[np.ndarray, list], **kwargs) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Blocking wrapper around sweep() for scripts. Takes the same arguments.
+
+    Returns:
+    tuple: (freqs, mags, phase) arrays, phase in degrees.
+    """
+    return asyncio.run(sweep(host, port, freqs, **kwargs))
+
+def run_simulated_sweep(
+    instrument: SimulatedInstrument, freqs: Union[np.ndarray, list], **kwargs
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Start a simulated instrument on a free local port, sweep it and shut it down.
+    Takes the same keyword arguments as sweep().
+
+    Example:
+    freqs, mags, phase = run_simulated_sweep(SimulatedInstrument.lowpass(9.96e3, 1e-9), np.logspace(3, 6, 50))
+    bode_plot(freqs, mags, phase)
+
+    Returns:
+    tuple: (freqs, mags, phase) arrays, phase in degrees.
+    """
+    async def _run():
+        async with instrument:
+            return await sweep(*instrument.address, freqs, **kwargs)
+    return asyncio.run(_run())
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import numpy as np
+
 # ---------- Multi-use functions ----------
 
 def percent_error(measured: float, theoretical: float) -> float:
@@ -7,12 +9,13 @@ def percent_error(measured: float, theoretical: float) -> float:
     Calculate the percent error between measured and theoretical values.
 
     Parameters:
-    measured (float): The measured value.
-    theoretical (float): The theoretical value.
+    measured (float or array): The measured value.
+    theoretical (float or array): The theoretical value.
 
     Returns:
-    float: The percent error.
+    float or array: The percent error.
     """
-    if theoretical == 0:
-        return float('inf')  # Infinite percent error if theoretical value is zero
-    return abs((measured - theoretical) / theoretical) * 100.0
\ No newline at end of file
+    theoretical = np.asarray(theoretical, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        error = np.abs((measured - theoretical) / theoretical) * 100.0
+    return np.where(theoretical == 0, np.inf, error)[()]  # Infinite percent error if theoretical value is zero
\ No newline at end of file
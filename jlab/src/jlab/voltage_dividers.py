@@ -1,10 +1,13 @@
 from __future__ import annotations
 from typing import List
 
+import numpy as np
+
 # ----------- Voltage Divider Calculations -----------
 def voltage_divider(v_in: float, resistors: List[float]) -> List[float]:
     """
     Calculate the output voltages at each node of a voltage divider. Should ignore the first node (input voltage).
+    For taps with loads, see ladder_solve.
 
     Parameters:
     v_in (float): The input voltage in volts.
@@ -13,16 +16,10 @@ def voltage_divider(v_in: float, resistors: List[float]) -> List[float]:
     Returns:
     list: A list of output voltages at each node in volts.
     """
-    total_resistance = sum(resistors)
-    voltages = []
-    v_out = v_in
-    for r in resistors[:-1]:
-        v_drop = (r / total_resistance) * v_in
-        v_out -= v_drop
-        voltages.append(v_out)
-        total_resistance -= r
-    return voltages
-    
+    resistors = np.asarray(resistors, dtype=float)
+    total_resistance = resistors.sum()
+    r_below = total_resistance - np.cumsum(resistors)[:-1]
+    return (v_in * r_below / total_resistance).tolist()
 
 def current_through_voltage_divider(v_in: float, resistors: List[float]) -> float:
     """
@@ -43,6 +40,7 @@ def current_through_voltage_divider(v_in: float, resistors: List[float]) -> floa
 def transfer_function_voltage_divider(resistors: List[float]) -> List[float]:
     """
     Calculate the transfer function (voltage ratios) of a voltage divider.
+    For taps with loads, see ladder_solve.
 
     Parameters:
     resistors (list): A list of resistance values in ohms.
@@ -50,11 +48,7 @@ def transfer_function_voltage_divider(resistors: List[float]) -> List[float]:
     Returns:
     list: A list of voltage ratios at each node.
     """
-    total_resistance = sum(resistors)
-    transfer_functions = []
-    v_out = total_resistance
-    for r in resistors[1:]:
-        tf = r / v_out
-        transfer_functions.append(tf)
-        v_out -= r
-    return transfer_functions
\ No newline at end of file
+    resistors = np.asarray(resistors, dtype=float)
+    total_resistance = resistors.sum()
+    r_below = total_resistance - np.cumsum(resistors)[:-1]
+    return (r_below / total_resistance).tolist()
\ No newline at end of file